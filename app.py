@@ -1,5 +1,8 @@
+import uuid
+
 import streamlit as st
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from jobspy import scrape_jobs
 from jobspy.model import Country
 
@@ -8,6 +11,131 @@ st.set_page_config(page_title="JobSpy Web App", layout="wide")
 st.title("🔎 JobSpy Web Scraper")
 st.write("Enter your job search criteria below and see the results from multiple job boards.")
 
+# Aggregate regions that can't be selected as a search country
+EXCLUDED_COUNTRIES = frozenset({Country.US_CANADA, Country.WORLDWIDE})
+
+# (checkbox label, scrape_jobs site name) for each selectable job board
+SITE_OPTIONS = (
+    ("Indeed", "indeed"),
+    ("LinkedIn", "linkedin"),
+    ("ZipRecruiter", "zip_recruiter"),
+    ("Google", "google"),
+    ("Glassdoor", "glassdoor"),
+    ("Bayt", "bayt"),
+    ("Naukri", "naukri"),
+    ("BDJobs", "bdjobs"),
+)
+DEFAULT_CHECKED_SITES = frozenset({"Indeed", "LinkedIn", "Google"})
+
+
+@st.cache_data
+def get_country_names() -> list[str]:
+    """Builds the sorted list of countries from the JobSpy model."""
+    return sorted([
+        country.value[0].split(',')[0].title()
+        for country in Country
+        if country not in EXCLUDED_COUNTRIES
+    ])
+
+
+class NoJobsFound(Exception):
+    """Raised from the cached scrape so empty results are never stored in the cache."""
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_scrape_jobs(site_names: tuple[str, ...], cache_token: str | None, **kwargs) -> pd.DataFrame:
+    """
+    Calls scrape_jobs, reusing results for identical searches made within the last hour.
+    cache_token is only part of the cache key, letting one session bypass earlier results.
+    """
+    jobs_df = scrape_jobs(site_name=list(site_names), **kwargs)
+    if jobs_df.empty:
+        # Scrapers return empty results when rate limited; raising keeps them out of the cache
+        raise NoJobsFound
+    return jobs_df
+
+
+def refresh_scrape_cache():
+    """Gives this session a new cache token so its searches skip previously cached results."""
+    st.session_state.scrape_cache_token = uuid.uuid4().hex
+
+
+@st.cache_data(ttl=3600, max_entries=4, show_spinner=False)
+def combine_jobs(frames: tuple[pd.DataFrame, ...]) -> pd.DataFrame:
+    """Combines the per-title results, rebuilding only when the set of results changes."""
+    combined_jobs_df = pd.concat(frames, ignore_index=True, copy=False, sort=False)
+    # Arrow-backed strings are far lighter than Python objects. Converting once after the
+    # concat keeps dtypes independent of which titles were searched, and
+    # convert_integer=False keeps whole-number salaries as floats.
+    return combined_jobs_df.convert_dtypes(dtype_backend='pyarrow', convert_integer=False)
+
+
+@st.cache_data(ttl=3600, max_entries=2, show_spinner=False)
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Encodes the results as CSV, only re-serializing when the results change."""
+    return df.to_csv(index=False).encode('utf-8')
+
+
+def display_value(value, placeholder: str = "Not available") -> str:
+    """Formats a job field for display; missing values are pd.NA with the pyarrow backend."""
+    return placeholder if pd.isna(value) else str(value)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def render_description(description: str) -> str:
+    """Wraps a job description in a scrollable box, built once per selected job."""
+    return f"<div style='height: 400px; overflow-y: auto; border: 1px solid #ddd; padding: 10px; border-radius: 5px;'>{description}</div>"
+
+
+@st.fragment
+def render_term_results(term: str, term_df: pd.DataFrame, all_jobs_df: pd.DataFrame):
+    """Renders the job list and details for one search term; selecting a job reruns only this block."""
+    with st.expander(f"📂 Results for '{term}' ({len(term_df)} jobs found)", expanded=True):
+        col1, col2 = st.columns([1, 2])
+
+        with col1:
+            st.subheader("Job List")
+            # A single virtualized table with row selection instead of one button per job
+            event = st.dataframe(
+                term_df[['title', 'company', 'location']],
+                key=f"job_list_{term}",
+                on_select="rerun",
+                selection_mode="single-row",
+                hide_index=True,
+                use_container_width=True,
+                height=550,
+            )
+            selected_rows = event.selection.rows
+            # Map the selected row back to its index in the full results frame; a
+            # selection left over from earlier results can point past the end
+            selected_index = (
+                term_df.index[selected_rows[0]]
+                if selected_rows and selected_rows[0] < len(term_df)
+                else None
+            )
+
+        with col2:
+            st.subheader("Job Details")
+            if selected_index is not None:
+                selected_job = all_jobs_df.loc[selected_index]
+
+                st.markdown(f"#### {display_value(selected_job['title'])}")
+                st.markdown(f"**🏢 Company:** {display_value(selected_job['company'])}")
+                st.markdown(f"**📍 Location:** {display_value(selected_job['location'])}")
+                st.markdown(f"**🔗 Source:** {display_value(selected_job['site'])}")
+
+                # Use a more prominent button for applying
+                if pd.notna(selected_job['job_url']):
+                    st.link_button("🚀 Apply Here on a New Tab", selected_job['job_url'], use_container_width=True, type="primary")
+
+                st.markdown("---")
+                st.markdown("##### Job Description")
+                description = display_value(selected_job['description'], "No description available.")
+                st.markdown(render_description(description), unsafe_allow_html=True)
+            else:
+                st.info("Select a job from the list on the left to see its details.")
+
+
 # --- User Inputs in Sidebar ---
 st.sidebar.header("Search Parameters")
 
@@ -20,12 +148,7 @@ job_titles_to_search = [title.strip() for title in job_titles_str.split('\n') if
 
 # --- Location and Country Selection ---
 
-# Create a list of countries from the JobSpy model
-country_names = sorted([
-    country.value[0].split(',')[0].title() 
-    for country in Country 
-    if country not in (Country.US_CANADA, Country.WORLDWIDE)
-])
+country_names = get_country_names()
 
 selected_country = st.sidebar.selectbox(
     "Country",
@@ -41,29 +164,23 @@ st.sidebar.subheader("Job Sites")
 # ZipRecruiter is only available in US/Canada
 is_ziprecruiter_available = selected_country in ["Usa", "Canada"]
 
-site_options = {
-    "Indeed": "indeed",
-    "LinkedIn": "linkedin",
-    "ZipRecruiter": "zip_recruiter",
-    "Google": "google",
-    "Glassdoor": "glassdoor",
-    "Bayt": "bayt",
-    "Naukri": "naukri",
-    "BDJobs": "bdjobs"
-}
-
 sites = []
-for label, site_name in site_options.items():
+for label, site_name in SITE_OPTIONS:
     if site_name == "zip_recruiter":
         # Disable ZipRecruiter if the country is not US or Canada
-        if st.sidebar.checkbox(label, value=(label in ["Indeed", "LinkedIn", "Google"]), disabled=not is_ziprecruiter_available, help="Only available for USA and Canada"):
+        if st.sidebar.checkbox(label, value=(label in DEFAULT_CHECKED_SITES), disabled=not is_ziprecruiter_available, help="Only available for USA and Canada"):
             sites.append(site_name)
-    elif st.sidebar.checkbox(label, value=(label in ["Indeed", "LinkedIn", "Google"])):
+    elif st.sidebar.checkbox(label, value=(label in DEFAULT_CHECKED_SITES)):
         sites.append(site_name)
 
 # Other Parameters
 results_wanted = st.sidebar.slider("Results Wanted (per site)", 1, 100, 20)
 hours_old = st.sidebar.slider("Hours Old (max)", 1, 720, 72)
+st.sidebar.button(
+    "🔄 Refresh cached results",
+    on_click=refresh_scrape_cache,
+    help="Your next search fetches from the job boards again instead of reusing results from the last hour.",
+)
 
 
 # --- Main App Logic ---
@@ -123,41 +240,79 @@ if st.button("🚀 Search for Jobs"):
                 st.info("Search radius is disabled when 'Remote Only' is selected.", icon="ℹ️")
 
         st.session_state.jobs_df = pd.DataFrame() # Clear previous results
-        all_jobs = []
+        # Read here: session state isn't available inside the worker threads
+        cache_token = st.session_state.get('scrape_cache_token')
+        jobs_by_term = {}
 
         total_searches = len(job_titles_to_search)
         progress_bar = st.progress(0, text=f"Starting search for {total_searches} job title(s)...")
 
-        for i, search_term in enumerate(job_titles_to_search):
-            progress_text = f"Searching for '{search_term}' ({i + 1}/{total_searches})"
-            progress_bar.progress(i / total_searches, text=progress_text)
-
+        def search_for_title(search_term: str) -> pd.DataFrame:
+            """Calls scrape_jobs for a given search term and returns the results."""
             # Dynamically create google_search_term
             final_google_search = google_search_override or f'"{search_term}" jobs in {location}'
 
-            jobs_df = scrape_jobs(
-                site_name=sites,
-                search_term=search_term,
-                google_search_term=final_google_search,
-                location=location,
-                distance=distance,
-                results_wanted=results_wanted,
-                hours_old=hours_old,
-                job_type=job_type,
-                is_remote=is_remote,
-                offset=offset,
-                easy_apply=easy_apply,
-                linkedin_fetch_description=linkedin_fetch_description,
-                country_indeed=selected_country,
-            )
-            if not jobs_df.empty:
-                jobs_df['search_term'] = search_term
-                all_jobs.append(jobs_df)
+            try:
+                return cached_scrape_jobs(
+                    tuple(sites),
+                    cache_token,
+                    search_term=search_term,
+                    google_search_term=final_google_search,
+                    location=location,
+                    distance=distance,
+                    results_wanted=results_wanted,
+                    hours_old=hours_old,
+                    job_type=job_type,
+                    is_remote=is_remote,
+                    offset=offset,
+                    easy_apply=easy_apply,
+                    linkedin_fetch_description=linkedin_fetch_description,
+                    country_indeed=selected_country,
+                    max_searches_per_site=2,
+                )
+            except NoJobsFound:
+                return pd.DataFrame()
+
+        # Each title is an independent, network-bound search, so run them concurrently
+        with (
+            st.status("Fetching jobs...", expanded=True) as status,
+            ThreadPoolExecutor(max_workers=min(total_searches, 8)) as executor,
+        ):
+            # Preview the jobs found so far while the remaining titles are still searching
+            preview = st.empty()
+            future_to_term = {
+                executor.submit(search_for_title, search_term): search_term
+                for search_term in job_titles_to_search
+            }
 
-        if all_jobs:
+            for completed, future in enumerate(as_completed(future_to_term), start=1):
+                search_term = future_to_term[future]
+                progress_text = f"Finished '{search_term}' ({completed}/{total_searches})"
+                progress_bar.progress(completed / total_searches, text=progress_text)
+
+                jobs_df = future.result()
+                if not jobs_df.empty:
+                    jobs_by_term[search_term] = jobs_df.assign(search_term=search_term)
+                    preview.dataframe(
+                        pd.concat(
+                            [df[['search_term', 'title', 'company', 'location']] for df in jobs_by_term.values()],
+                            ignore_index=True,
+                            copy=False,
+                        ),
+                        hide_index=True,
+                        use_container_width=True,
+                    )
+
+            status.update(label="Fetching complete", state="complete", expanded=False)
+
+        if jobs_by_term:
             progress_bar.progress(1.0, text="All searches complete! Compiling results...")
-            combined_jobs_df = pd.concat(all_jobs, ignore_index=True)
-            st.session_state.jobs_df = combined_jobs_df
+            # Keep the terms in the order they were entered, not the order searches finished
+            search_terms = [
+                term for term in dict.fromkeys(job_titles_to_search) if term in jobs_by_term
+            ]
+            st.session_state.jobs_df = combine_jobs(tuple(jobs_by_term[term] for term in search_terms))
+            st.session_state.search_terms = search_terms
         else:
             st.warning("No jobs found for the given criteria.")
 
@@ -169,52 +324,18 @@ if 'jobs_df' in st.session_state and not st.session_state.jobs_df.empty:
     # Provide a download button for the full results first
     st.download_button(
         label="📥 Download All Results as CSV",
-        data=st.session_state.jobs_df.to_csv(index=False).encode('utf-8'),
+        data=to_csv_bytes(st.session_state.jobs_df),
         file_name='jobs.csv',
         mime='text/csv',
     )
 
     all_jobs_df = st.session_state.jobs_df
-    search_terms = all_jobs_df['search_term'].unique()
-
-    for term in search_terms:
-        term_df = all_jobs_df[all_jobs_df['search_term'] == term].copy()
-        term_df.reset_index(drop=True, inplace=True) # Important for selection indexing
-
-        with st.expander(f"📂 Results for '{term}' ({len(term_df)} jobs found)", expanded=True):
-            col1, col2 = st.columns([1, 2])
-
-            with col1:
-                # Initialize session state for selected job for this term if not present
-                if f'selected_job_index_{term}' not in st.session_state:
-                    st.session_state[f'selected_job_index_{term}'] = None
-
-                st.subheader("Job List")
-                # Create a container with a fixed height and border for the job list
-                with st.container(height=550, border=True):
-                    for index, row in term_df.iterrows():
-                        # Use a button for each job. The label includes title, company, and location.
-                        button_label = f"**{row['title']}**\n\n*at {row['company']} in {row['location']}*"
-                        if st.button(button_label, key=f"btn_{term}_{index}", use_container_width=True):
-                            st.session_state[f'selected_job_index_{term}'] = index
-
-            with col2:
-                st.subheader("Job Details")
-                selected_index = st.session_state.get(f'selected_job_index_{term}')
-
-                if selected_index is not None:
-                    selected_job = term_df.iloc[selected_index]
-
-                    st.markdown(f"#### {selected_job['title']}")
-                    st.markdown(f"**🏢 Company:** {selected_job['company']}")
-                    st.markdown(f"**📍 Location:** {selected_job['location']}")
-                    st.markdown(f"**🔗 Source:** {selected_job['site']}")
-                    
-                    # Use a more prominent button for applying
-                    st.link_button("🚀 Apply Here on a New Tab", selected_job['job_url'], use_container_width=True, type="primary")
+    # Only the list columns are partitioned; details are read from the full frame
+    list_df = all_jobs_df[['title', 'company', 'location', 'search_term']]
+
+    # Partition the results by search term in a single pass
+    term_groups = list_df.groupby('search_term', sort=False)
 
-                    st.markdown("---")
-                    st.markdown("##### Job Description")
-                    st.markdown(f"<div style='height: 400px; overflow-y: auto; border: 1px solid #ddd; padding: 10px; border-radius: 5px;'>{selected_job['description']}</div>", unsafe_allow_html=True)
-                else:
-                    st.info("Select a job from the list on the left to see its details.")
\ No newline at end of file
+    for term in st.session_state.search_terms:
+        term_df = term_groups.get_group(term)
+        render_term_results(term, term_df, all_jobs_df)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Tuple
 
@@ -25,6 +28,19 @@ from jobspy.util import (
 )
 from jobspy.ziprecruiter import ZipRecruiter
 
+# Semaphores shared by scrape_jobs calls passing max_searches_per_site, keyed by
+# (site, limit). They bound whole searches on a site, not the individual
+# requests a scraper makes within one search.
+_site_semaphores: dict[tuple[Site, int], threading.BoundedSemaphore] = {}
+_site_semaphores_lock = threading.Lock()
+
+
+def _get_site_semaphore(site: Site, limit: int) -> threading.BoundedSemaphore:
+    with _site_semaphores_lock:
+        if (site, limit) not in _site_semaphores:
+            _site_semaphores[(site, limit)] = threading.BoundedSemaphore(limit)
+        return _site_semaphores[(site, limit)]
+
 
 # Update the SCRAPER_MAPPING dictionary in the scrape_jobs function
 
@@ -49,6 +65,7 @@ def scrape_jobs(
     enforce_annual_salary: bool = False,
     verbose: int = 0,
     user_agent: str = None,
+    max_searches_per_site: int | None = None,
     **kwargs,
 ) -> pd.DataFrame:
     """
@@ -104,7 +121,13 @@ def scrape_jobs(
     def scrape_site(site: Site) -> Tuple[str, JobResponse]:
         scraper_class = SCRAPER_MAPPING[site]
         scraper = scraper_class(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
+        site_limit = (
+            _get_site_semaphore(site, max_searches_per_site)
+            if max_searches_per_site
+            else contextlib.nullcontext()
+        )
+        with site_limit:
+            scraped_data: JobResponse = scraper.scrape(scraper_input)
         cap_name = site.value.capitalize()
         site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
         site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
@@ -221,6 +244,16 @@ def scrape_jobs(
         return pd.DataFrame()
 
 
+async def scrape_jobs_async(*args, **kwargs) -> pd.DataFrame:
+    """
+    Awaitable version of scrape_jobs, taking the same parameters, for use from
+    async code. Each call runs scrape_jobs in a worker thread, so gathering
+    searches is no cheaper than running them in a thread pool.
+    :return: Pandas DataFrame containing job data
+    """
+    return await asyncio.to_thread(scrape_jobs, *args, **kwargs)
+
+
 # Add BDJobs to __all__
 __all__ = [
     "BDJobs",
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 from itertools import cycle
 
 import numpy as np
@@ -61,17 +62,9 @@ class RequestsRotating(RotatingProxySession, requests.Session):
         self.setup_session(has_retry, delay)
 
     def setup_session(self, has_retry, delay):
-        if has_retry:
-            retries = Retry(
-                total=3,
-                connect=3,
-                status=3,
-                status_forcelist=[500, 502, 503, 504, 429],
-                backoff_factor=delay,
-            )
-            adapter = HTTPAdapter(max_retries=retries)
-            self.mount("http://", adapter)
-            self.mount("https://", adapter)
+        adapter = get_shared_adapter(has_retry, delay)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
 
     def request(self, method, url, **kwargs):
         if self.clear_cookies:
@@ -86,6 +79,36 @@ class RequestsRotating(RotatingProxySession, requests.Session):
         return requests.Session.request(self, method, url, **kwargs)
 
 
+_shared_adapters: dict[tuple[bool, int], HTTPAdapter] = {}
+_shared_adapters_lock = threading.Lock()
+
+
+def get_shared_adapter(has_retry: bool = False, delay: int = 1) -> HTTPAdapter:
+    """
+    Returns a process-wide adapter for the given retry settings, so sessions
+    created by separate scrape_jobs calls reuse warm keep-alive connections.
+    Cookies and headers stay on each session; only the connection pool is shared.
+    """
+    key = (has_retry, delay if has_retry else 0)
+    with _shared_adapters_lock:
+        adapter = _shared_adapters.get(key)
+        if adapter is None:
+            retries = (
+                Retry(
+                    total=3,
+                    connect=3,
+                    status=3,
+                    status_forcelist=[500, 502, 503, 504, 429],
+                    backoff_factor=delay,
+                )
+                if has_retry
+                else 0
+            )
+            adapter = HTTPAdapter(pool_maxsize=20, max_retries=retries)
+            _shared_adapters[key] = adapter
+        return adapter
+
+
 class TLSRotating(RotatingProxySession, tls_client.Session):
     def __init__(self, proxies=None):
         RotatingProxySession.__init__(self, proxies=proxies)
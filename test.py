@@ -16,13 +16,14 @@ def search_for_title(search_term: str) -> pd.DataFrame:
         results_wanted=20,
         hours_old=72,
         country_indeed='UK',
+        max_searches_per_site=2,
         # linkedin_fetch_description=True # gets more info such as description, direct job url (slower)
         # proxies=["208.195.175.46:65095", "208.195.175.45:65095", "localhost"],
     )
 
     # Add a column to track which search term this job came from
     if not jobs_df.empty:
-        jobs_df['search_term'] = search_term
+        jobs_df = jobs_df.assign(search_term=search_term)
 
     print(f"Found {len(jobs_df)} jobs for: {search_term}")
     return jobs_df
@@ -34,7 +35,8 @@ if __name__ == "__main__":
 
     all_jobs = []
 
-    with ThreadPoolExecutor() as executor:
+    # Keep the pool small; max_searches_per_site also caps concurrent searches per site
+    with ThreadPoolExecutor(max_workers=min(len(job_titles_to_search), 4)) as executor:
         # Submit all search tasks to the executor
         future_to_title = {executor.submit(search_for_title, title): title for title in job_titles_to_search}
 
@@ -42,9 +44,14 @@ if __name__ == "__main__":
             all_jobs.append(future.result())
 
     # Combine all the results into a single DataFrame
-    combined_jobs_df = pd.concat(all_jobs, ignore_index=True)
+    combined_jobs_df = pd.concat(all_jobs, ignore_index=True, copy=False, sort=False)
 
-    print(f"\nFound a total of {len(combined_jobs_df)} jobs across all searches.")
-    print(combined_jobs_df.head())
-    combined_jobs_df.to_excel("jobs.xlsx", index=False)
+    # Writing xlsx is slow, so start it in the background while the summary is printed
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        excel_future = writer.submit(combined_jobs_df.to_excel, "jobs.xlsx", index=False)
+
+        print(f"\nFound a total of {len(combined_jobs_df)} jobs across all searches.")
+        print(combined_jobs_df.head())
+
+    excel_future.result()
     print("\nSaved all jobs to jobs.xlsx")
\ No newline at end of file